@@ -27,7 +27,15 @@ SERVICE_CONFIG_FILE : str
     Path to service configuration file (alternative to --service-config-file)
 """
 
-from mcp_server_snowflake.server import mcp, main
-
 __all__ = ["mcp", "main"]
-__version__ = "2.0.0"
\ No newline at end of file
+__version__ = "2.0.0"
+
+
+def __getattr__(name):
+    # Defer importing the server, and with it the Snowflake connector, until
+    # ``mcp`` or ``main`` is first used rather than on any package import
+    if name in __all__:
+        from mcp_server_snowflake import server
+
+        return getattr(server, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
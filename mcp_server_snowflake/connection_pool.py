@@ -0,0 +1,197 @@
+# Copyright 2025 Snowflake Inc.
+# SPDX-License-Identifier: Apache-2.0
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+# http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator
+
+logger = logging.getLogger(__name__)
+
+
+class ConnectionPool:
+    """
+    Bounded pool of Snowflake connections shared across tool invocations.
+
+    Opening a Snowflake connection costs a TLS handshake, an authentication
+    round-trip and session setup. The pool keeps connections open after use
+    so subsequent tool calls can borrow a warm session instead of dialing a
+    new one.
+
+    Parameters
+    ----------
+    creator : Callable[[], SnowflakeConnection]
+        Zero-argument callable that opens a new connection
+    pool_size : int, optional
+        Maximum number of connections checked out at once, by default 5
+    timeout : float, optional
+        Seconds to wait for a free connection before giving up, by default 120
+    min_size : int, optional
+        Connections to open up front so the first calls skip the login, by default 0.
+        They are opened concurrently, so startup waits for one login rather than
+        ``min_size`` logins in a row
+    lifetime : float, optional
+        Seconds after which a connection is closed instead of reused, by default 1800
+    validate : bool, optional
+        Check that an idle connection's session is still valid before reusing it,
+        by default True
+    validate_interval : float, optional
+        Skip validation for connections returned less than this many seconds ago,
+        by default 30
+
+    Examples
+    --------
+    >>> pool = ConnectionPool(lambda: connect(**params), pool_size=5)
+    >>> with pool.connect() as conn:
+    ...     conn.cursor().execute("SELECT 1")
+    """
+
+    def __init__(
+        self,
+        creator: Callable[[], Any],
+        pool_size: int = 5,
+        timeout: float = 120,
+        min_size: int = 0,
+        lifetime: float = 1800,
+        validate: bool = True,
+        validate_interval: float = 30,
+    ):
+        self._creator = creator
+        self._timeout = timeout
+        self._lifetime = lifetime
+        self._validate = validate
+        self._validate_interval = validate_interval
+        # Idle entries are (connection, opened_at, returned_at) in monotonic seconds
+        self._idle: queue.LifoQueue = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(pool_size)
+
+        if min_size > 0:
+            self._prefill(min(min_size, pool_size))
+
+    @contextmanager
+    def connect(self, reuse: bool = True) -> Iterator[Any]:
+        """
+        Borrow a connection from the pool for the duration of the context.
+
+        Idle connections are reused most-recently-used first, skipping any that
+        have outlived the pool lifetime or fail validation. The connection is
+        returned to the pool on exit, or discarded if it has been closed, has
+        expired or must not be reused.
+
+        Parameters
+        ----------
+        reuse : bool, optional
+            Return the connection to the pool on exit; pass False when the
+            borrower may have changed session state, by default True
+
+        Yields
+        ------
+        SnowflakeConnection
+            An open Snowflake connection
+
+        Raises
+        ------
+        TimeoutError
+            If no connection becomes available within the pool timeout
+        """
+        if not self._slots.acquire(timeout=self._timeout):
+            raise TimeoutError(
+                f"Timed out after {self._timeout}s waiting for a Snowflake connection."
+            )
+
+        try:
+            conn, opened_at = self._checkout()
+        except BaseException:
+            self._slots.release()
+            raise
+
+        try:
+            yield conn
+        finally:
+            if conn.is_closed():
+                logger.info("Discarding closed Snowflake connection from pool")
+            elif not reuse or self._expired(opened_at, time.monotonic()):
+                self._discard(conn)
+            else:
+                self._idle.put((conn, opened_at, time.monotonic()))
+            self._slots.release()
+
+    def close(self) -> None:
+        """Close every idle connection held by the pool."""
+        while True:
+            try:
+                conn, _, _ = self._idle.get_nowait()
+            except queue.Empty:
+                return
+            self._discard(conn)
+
+    def _open(self) -> tuple[Any, float]:
+        """Open a new connection and record when it was opened."""
+        return self._creator(), time.monotonic()
+
+    def _prefill(self, count: int) -> None:
+        """Open ``count`` idle connections in parallel so their logins overlap."""
+        with ThreadPoolExecutor(
+            max_workers=count, thread_name_prefix="snowflake-pool"
+        ) as executor:
+            futures = [executor.submit(self._open) for _ in range(count)]
+
+        errors = []
+        for future in futures:
+            try:
+                conn, opened_at = future.result()
+            except Exception as e:
+                errors.append(e)
+                continue
+            self._idle.put((conn, opened_at, opened_at))
+
+        if errors:
+            logger.error(
+                "Failed to pre-open %d pooled Snowflake connection(s): %s",
+                len(errors),
+                errors[0],
+            )
+
+    def _checkout(self) -> tuple[Any, float]:
+        """Take the most recently used healthy idle connection, or open a new one."""
+        while True:
+            try:
+                conn, opened_at, returned_at = self._idle.get_nowait()
+            except queue.Empty:
+                return self._open()
+
+            now = time.monotonic()
+            if self._expired(opened_at, now):
+                self._discard(conn)
+            elif (
+                self._validate
+                and now - returned_at >= self._validate_interval
+                and not conn.is_valid()
+            ):
+                logger.info("Discarding invalid Snowflake connection from pool")
+                self._discard(conn)
+            else:
+                return conn, opened_at
+
+    def _expired(self, opened_at: float, now: float) -> bool:
+        """Whether a connection has outlived the pool lifetime."""
+        return now - opened_at >= self._lifetime
+
+    @staticmethod
+    def _discard(conn: Any) -> None:
+        """Close a connection that is leaving the pool, logging any failure."""
+        try:
+            conn.close()
+        except Exception as e:
+            logger.error("Error closing pooled Snowflake connection: %s", e)
@@ -9,6 +9,7 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import asyncio
 from typing import Annotated, Optional
 
 import requests
@@ -89,7 +90,9 @@ async def query_cortex_search(
     if isinstance(columns, list) and len(columns) > 0:
         payload["columns"] = columns
 
-    response = requests.post(host, headers=headers, json=payload)
+    response = await asyncio.to_thread(
+        requests.post, host, headers=headers, json=payload
+    )
 
     if response.status_code == 200:
         return response
@@ -230,7 +233,9 @@ async def query_cortex_analyst(
         "stream": False,
     }
 
-    response = requests.post(host, headers=headers, json=payload)
+    response = await asyncio.to_thread(
+        requests.post, host, headers=headers, json=payload
+    )
 
     if response.status_code == 200:
         return response
@@ -87,5 +87,5 @@ def get_spcs_container_token() -> str:
         with open(token_path, "r") as f:
             return f.read().strip()
     except Exception as e:
-        logger.error(f"Error reading container token: {e}")
+        logger.error("Error reading container token: %s", e)
         raise
\ No newline at end of file
@@ -1,6 +1,6 @@
-import json
 from typing import Literal, TypeAlias
 
+import orjson
 from pydantic import BaseModel, Field, model_validator
 from snowflake.core import Root
 from snowflake.core.compute_pool import ComputePool
@@ -33,8 +33,8 @@ class ObjectMetadata(BaseModel):
         """
         if isinstance(data, str):
             try:
-                return json.loads(data)
-            except json.JSONDecodeError as e:
+                return orjson.loads(data)
+            except orjson.JSONDecodeError as e:
                 raise ValueError(f"Invalid JSON string: {e}")
         return data
 
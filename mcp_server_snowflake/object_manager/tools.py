@@ -1,6 +1,6 @@
-import json
 from typing import Annotated, Any, Literal, Union, get_args
 
+import orjson
 from fastmcp import FastMCP
 from pydantic import Field
 from snowflake.core import CreateMode, Root
@@ -22,7 +22,14 @@ from mcp_server_snowflake.object_manager.objects import (
 from mcp_server_snowflake.object_manager.prompts import (
     get_object_mgmt_prompt,
 )
-from mcp_server_snowflake.utils import SnowflakeException, execute_query
+from mcp_server_snowflake.utils import (
+    SnowflakeException,
+    clear_metadata_cache,
+    escape_pyformat,
+    execute_metadata_query,
+    run_blocking,
+    validate_identifiers,
+)
 
 
 def get_class_name(object_type: Any) -> str:
@@ -98,7 +105,17 @@ def list_objects(
     schema_name: str = None,
     like: str = None,
     starts_with: str = None,
+    refresh: bool = False,
 ):
+    validate_identifiers(
+        "list_objects", database_name=database_name, schema_name=schema_name
+    )
+
+    if like or starts_with:
+        # Patterns are bound below, so % in quoted identifiers must be escaped
+        database_name = escape_pyformat(database_name)
+        schema_name = escape_pyformat(schema_name)
+
     if object_type == "image_repository":
         object_name = "image repositories"
     elif object_type == "compute_pool":
@@ -106,21 +123,24 @@ def list_objects(
     else:
         object_name = f"{object_type}s"
 
-    statement = f"SHOW {object_name}"
+    # Collect clauses and join once; user-supplied patterns are bound, not interpolated
+    clauses = [f"SHOW {object_name}"]
+    params = {}
 
     if like:
-        statement += f" LIKE '%{like.replace('%', '')}%'"
+        clauses.append("LIKE %(like)s")
+        params["like"] = f"%{like.replace('%', '')}%"
 
     if object_type in ["database", "compute_pool", "role", "user"]:
         pass
     elif database_name is None and schema_name is None:
-        statement += " IN ACCOUNT"
+        clauses.append("IN ACCOUNT")
     elif database_name and schema_name:
-        statement += f" IN SCHEMA {database_name}.{schema_name}"
+        clauses.append(f"IN SCHEMA {database_name}.{schema_name}")
     elif database_name:
-        statement += f" IN DATABASE {database_name}"
+        clauses.append(f"IN DATABASE {database_name}")
     elif schema_name:
-        statement += f" IN SCHEMA {schema_name}"
+        clauses.append(f"IN SCHEMA {schema_name}")
     else:
         raise SnowflakeException(
             tool="list_objects",
@@ -128,13 +148,18 @@ def list_objects(
         )
 
     if starts_with:
-        statement += f" STARTS WITH '{starts_with}'"
+        clauses.append("STARTS WITH %(starts_with)s")
+        params["starts_with"] = starts_with
+
+    statement = " ".join(clauses)
 
     try:
-        result = execute_query(statement, snowflake_service)
+        result = execute_metadata_query(
+            statement, snowflake_service, limit=1000, refresh=refresh, params=params
+        )
 
         if len(result) > 0:
-            return result[0:1000]  # Limit to 1000 results
+            return result
         else:
             return f"No matching {object_name} found."
     except Exception as e:
@@ -171,7 +196,7 @@ def parse_object(target_object: Any, obj_type: supported_objects):
                 obj_type = SnowflakeImageRepository
             else:
                 raise ValueError(f"Invalid object type: {obj_type}")
-            parsed_data = json.loads(target_object)
+            parsed_data = orjson.loads(target_object)
             return obj_type(**parsed_data)
         except Exception as e:
             raise e
@@ -203,7 +228,7 @@ def initialize_object_manager_tools(server: FastMCP, snowflake_service):
         name="create_object",
         description=get_object_mgmt_prompt("create", supported_objects_list),
     )
-    def create_object_tool(
+    async def create_object_tool(
         object_type: object_type_annotation,
         target_object: target_object_annotation,
         mode: Literal[
@@ -212,47 +237,61 @@ def initialize_object_manager_tools(server: FastMCP, snowflake_service):
     ):
         # If string is passed, parse JSON and create object
         target_object = parse_object(target_object, object_type)
-        return create_object(target_object, root, mode)
+        result = await run_blocking(
+            snowflake_service, create_object, target_object, root, mode
+        )
+        clear_metadata_cache(snowflake_service)
+        return result
 
     @server.tool(
         name="drop_object",
         description=get_object_mgmt_prompt("drop", supported_objects_list),
     )
-    def drop_object_tool(
+    async def drop_object_tool(
         object_type: object_type_annotation,
         target_object: target_object_annotation,
         if_exists: bool = False,
     ):
         target_object = parse_object(target_object, object_type)
-        return drop_object(target_object, root, if_exists)
+        result = await run_blocking(
+            snowflake_service, drop_object, target_object, root, if_exists
+        )
+        clear_metadata_cache(snowflake_service)
+        return result
 
     @server.tool(
         name="create_or_alter_object",
         description=get_object_mgmt_prompt("create_or_alter", supported_objects_list),
     )
-    def create_or_alter_object_tool(
+    async def create_or_alter_object_tool(
         object_type: object_type_annotation,
         target_object: target_object_annotation,
     ):
         target_object = parse_object(target_object, object_type)
-        return create_or_alter_object(target_object, root)
+        result = await run_blocking(
+            snowflake_service, create_or_alter_object, target_object, root
+        )
+        clear_metadata_cache(snowflake_service)
+        return result
 
     @server.tool(
         name="describe_object",
         description=get_object_mgmt_prompt("describe", supported_objects_list),
     )
-    def describe_object_tool(
+    async def describe_object_tool(
         object_type: object_type_annotation,
         target_object: target_object_annotation,
     ):
         target_object = parse_object(target_object, object_type)
-        return describe_object(target_object, root)
+        return await run_blocking(
+            snowflake_service, describe_object, target_object, root
+        )
 
     @server.tool(
         name="list_objects",
         description=get_object_mgmt_prompt("list", supported_objects_list),
     )
-    def list_objects_tool(
+    async def list_objects_tool(
         object_type: object_type_annotation,
         database_name: str | None = None,
         schema_name: str | None = None,
@@ -270,19 +309,31 @@ def initialize_object_manager_tools(server: FastMCP, snowflake_service):
                 default=None,
             ),
         ] = None,
+        refresh: Annotated[
+            bool,
+            Field(
+                description="Bypass cached metadata and query Snowflake directly.",
+                default=False,
+            ),
+        ] = False,
     ):
-        return list_objects(
+        return await run_blocking(
+            snowflake_service,
+            list_objects,
             snowflake_service,
             object_type,
             database_name,
             schema_name,
             like,
             starts_with,
+            refresh,
         )
 
 
 def validate_object_tool(
-    function_name: str, sql_allow_list: list[str], sql_disallow_list: list[str]
+    function_name: str,
+    sql_allow_list: frozenset[str],
+    sql_disallow_list: frozenset[str],
 ) -> tuple[str, bool]:
     """
     Validates a function call against a list of allowed and disallowed object types.
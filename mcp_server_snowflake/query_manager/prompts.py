@@ -1,4 +1,6 @@
 query_tool_prompt = """
 Run a SQL query in Snowflake.
 DML and DDL queries are supported.
-Tool should only be used if other tools do not suffice."""
\ No newline at end of file
+Tool should only be used if other tools do not suffice.
+Results are returned as text: one JSON array of row objects keyed by column name.
+Fixed-point numbers, dates and timestamps appear as JSON strings."""
\ No newline at end of file
@@ -1,19 +1,47 @@
-from typing import Annotated
+import asyncio
+from contextlib import closing
+from typing import Annotated, Callable, Iterator
 
 import sqlglot
-from fastmcp import FastMCP
+from fastmcp import Context, FastMCP
 from pydantic import Field
 
 from mcp_server_snowflake.query_manager.prompts import query_tool_prompt
-from mcp_server_snowflake.utils import SnowflakeException
-
-
-def run_query(statement: str, snowflake_service):
+from mcp_server_snowflake.utils import (
+    SnowflakeException,
+    clear_metadata_cache,
+    encode_json_rows,
+    is_read_only_statement,
+    iter_query_batches,
+    prefetch_batches,
+    run_blocking,
+)
+
+
+def _count_rows(
+    batches: Iterator[list], on_batch: Callable[[int], None]
+) -> Iterator[list]:
+    """Pass batches through, reporting the running row count after each one."""
+    fetched = 0
+    for rows in batches:
+        fetched += len(rows)
+        on_batch(fetched)
+        yield rows
+
+
+def run_query(
+    statement: str,
+    snowflake_service,
+    limit: int | None = None,
+    on_batch: Callable[[int], None] | None = None,
+):
     """
-    Execute SQL statement and fetch all results using Snowflake connector.
+    Execute SQL statement and fetch results using Snowflake connector.
 
     Establishes a connection to Snowflake, executes the provided SQL statement,
-    and returns all results using a dictionary cursor for easier data access.
+    and encodes each fetched batch to JSON as it arrives so the full result set
+    is never held as Python objects. The next batch is fetched in the background
+    while the current one is encoded.
 
     Parameters
     ----------
@@ -21,11 +49,17 @@ def run_query(statement: str, snowflake_service):
         SQL statement to execute
     snowflake_service : SnowflakeService
         The Snowflake service instance to use for connection
+    limit : int, optional
+        Maximum number of rows to return. Fetching stops once this many rows
+        have been read, by default None (all rows)
+    on_batch : Callable[[int], None], optional
+        Called with the number of rows fetched so far after each batch,
+        by default None
 
     Returns
     -------
-    list[dict]
-        List of dictionaries containing query results with column names as keys
+    str
+        JSON array of objects containing query results with column names as keys
 
     Raises
     ------
@@ -33,15 +67,11 @@ def run_query(statement: str, snowflake_service):
         If connection fails or SQL execution encounters an error
     """
     try:
-        with snowflake_service.get_connection(
-            use_dict_cursor=True,
-            session_parameters=snowflake_service.get_query_tag_param(),
-        ) as (
-            con,
-            cur,
-        ):
-            cur.execute(statement)
-            return cur.fetchall()
+        batches = iter_query_batches(statement, snowflake_service, limit)
+        with closing(prefetch_batches(batches)) as prefetched:
+            if on_batch is not None:
+                return encode_json_rows(_count_rows(prefetched, on_batch))
+            return encode_json_rows(prefetched)
     except Exception as e:
         raise SnowflakeException(
             tool="query_manager",
@@ -55,13 +85,60 @@ def initialize_query_manager_tool(server: FastMCP, snowflake_service):
         name="run_snowflake_query",
         description=query_tool_prompt,
     )
-    def run_query_tool(
+    async def run_query_tool(
         statement: Annotated[
             str,
             Field(description="SQL query to execute"),
         ],
+        limit: Annotated[
+            int | None,
+            Field(
+                description="Optional maximum number of rows to return.",
+                default=None,
+                gt=0,
+            ),
+        ] = None,
+        ctx: Context | None = None,
     ):
-        return run_query(statement, snowflake_service)
+        on_batch = None
+        progress = []
+        if ctx is not None:
+            loop = asyncio.get_running_loop()
+
+            def on_batch(rows_fetched: int) -> None:
+                # Called from the worker thread; the notification is sent on the loop
+                progress.append(
+                    asyncio.run_coroutine_threadsafe(
+                        ctx.report_progress(
+                            progress=rows_fetched,
+                            total=limit,
+                            message=f"Fetched {rows_fetched} rows",
+                        ),
+                        loop,
+                    )
+                )
+
+        try:
+            result = await run_blocking(
+                snowflake_service,
+                run_query,
+                statement,
+                snowflake_service,
+                limit,
+                on_batch,
+            )
+        except Exception:
+            await asyncio.gather(
+                *map(asyncio.wrap_future, progress), return_exceptions=True
+            )
+            raise
+        # Every progress notification goes out before the result, and a failed
+        # notification is raised instead of being lost in a dropped future
+        await asyncio.gather(*map(asyncio.wrap_future, progress))
+        if not is_read_only_statement(statement):
+            # DDL such as CREATE SEMANTIC VIEW can change cached SHOW/DESCRIBE output
+            clear_metadata_cache(snowflake_service)
+        return result
 
 
 def get_statement_type(sql_string):
@@ -83,7 +160,7 @@ def get_statement_type(sql_string):
 
 
 def validate_sql_type(
-    sql_string: str, sql_allow_list: list[str], sql_disallow_list: list[str]
+    sql_string: str, sql_allow_list: frozenset[str], sql_disallow_list: frozenset[str]
 ) -> tuple[str, bool]:
     """
     Validates a SQL statement type against a list of allowed and disallowed statement types.
@@ -8,7 +8,14 @@ from mcp_server_snowflake.semantic_manager.prompts import (
     query_semantic_view_prompt,
     write_semantic_view_query_prompt,
 )
-from mcp_server_snowflake.utils import SnowflakeException, execute_query
+from mcp_server_snowflake.utils import (
+    SnowflakeException,
+    escape_pyformat,
+    execute_metadata_query,
+    execute_query,
+    run_blocking,
+    validate_identifiers,
+)
 
 
 def list_semantic_views(
@@ -17,20 +24,33 @@ def list_semantic_views(
     schema_name: str = None,
     like: str = None,
     starts_with: str = None,
+    refresh: bool = False,
 ):
-    statement = "SHOW SEMANTIC VIEWS"
+    validate_identifiers(
+        "list_semantic_views", database_name=database_name, schema_name=schema_name
+    )
+
+    if like or starts_with:
+        # Patterns are bound below, so % in quoted identifiers must be escaped
+        database_name = escape_pyformat(database_name)
+        schema_name = escape_pyformat(schema_name)
+
+    # Collect clauses and join once; user-supplied patterns are bound, not interpolated
+    clauses = ["SHOW SEMANTIC VIEWS"]
+    params = {}
 
     if like:
-        statement += f" LIKE '%{like.replace('%', '')}%'"
+        clauses.append("LIKE %(like)s")
+        params["like"] = f"%{like.replace('%', '')}%"
 
     if not database_name and not schema_name:
-        statement += " IN ACCOUNT"
+        clauses.append("IN ACCOUNT")
     elif database_name and schema_name:
-        statement += f" IN SCHEMA {database_name}.{schema_name}"
+        clauses.append(f"IN SCHEMA {database_name}.{schema_name}")
     elif database_name:
-        statement += f" IN DATABASE {database_name}"
+        clauses.append(f"IN DATABASE {database_name}")
     elif schema_name:
-        statement += f" IN SCHEMA {schema_name}"
+        clauses.append(f"IN SCHEMA {schema_name}")
     else:
         raise SnowflakeException(
             tool="list_semantic_views",
@@ -38,20 +58,31 @@ def list_semantic_views(
         )
 
     if starts_with:
-        statement += f" STARTS WITH '{starts_with}'"
+        clauses.append("STARTS WITH %(starts_with)s")
+        params["starts_with"] = starts_with
+
+    statement = " ".join(clauses)
 
     try:
-        result = execute_query(statement, snowflake_service)
-        # Semantic view metadata has unnecessary extension key
-        for item in result:
-            item.pop("extension", None)
-        return result
+        # Semantic view metadata has unnecessary extension column; drop it before
+        # rows are built rather than rewriting every row afterwards
+        return execute_metadata_query(
+            statement,
+            snowflake_service,
+            refresh=refresh,
+            params=params,
+            drop_columns=frozenset({"extension"}),
+        )
     except Exception as e:
         raise SnowflakeException(tool="list_semantic_views", message=e)
 
 
 def describe_semantic_view(
-    snowflake_service, view_name: str, database_name: str, schema_name: str
+    snowflake_service,
+    view_name: str,
+    database_name: str,
+    schema_name: str,
+    refresh: bool = False,
 ):
     if not database_name and not schema_name:
         raise SnowflakeException(
@@ -61,14 +92,19 @@ def describe_semantic_view(
         raise SnowflakeException(
             tool="describe_semantic_view", message="Please specify a view name."
         )
+    validate_identifiers(
+        "describe_semantic_view",
+        view_name=view_name,
+        database_name=database_name,
+        schema_name=schema_name,
+    )
 
     statement = f"DESCRIBE SEMANTIC VIEW {database_name}.{schema_name}.{view_name}"
 
     try:
-        result = execute_query(statement, snowflake_service)
+        result = execute_metadata_query(statement, snowflake_service, refresh=refresh)
         # Semantic view metadata has ugly extension key, so we need to remove it
-        result = [item for item in result if item.get("object_kind") != "EXTENSION"]
-        return result
+        return [item for item in result if item.get("object_kind") != "EXTENSION"]
     except Exception as e:
         raise SnowflakeException(tool="list_semantic_views", message=e)
 
@@ -81,33 +117,52 @@ def show_semantic_expressions(
     view_name: str = None,
     like: str = None,
     starts_with: str = None,
+    refresh: bool = False,
 ):
-    statement = f"SHOW SEMANTIC {expression_type}"
+    validate_identifiers(
+        "show_semantic_expressions",
+        database_name=database_name,
+        schema_name=schema_name,
+        view_name=view_name,
+    )
+
+    if like or starts_with:
+        # Patterns are bound below, so % in quoted identifiers must be escaped
+        database_name = escape_pyformat(database_name)
+        schema_name = escape_pyformat(schema_name)
+        view_name = escape_pyformat(view_name)
+
+    # Collect clauses and join once; user-supplied patterns are bound, not interpolated
+    clauses = [f"SHOW SEMANTIC {expression_type}"]
+    params = {}
 
     if like:
-        statement += f" LIKE '%{like.replace('%', '')}%'"
+        clauses.append("LIKE %(like)s")
+        params["like"] = f"%{like.replace('%', '')}%"
 
     if view_name:
-        statement += " IN"
+        clauses.append("IN")
     elif schema_name:
-        statement += " IN SCHEMA"
+        clauses.append("IN SCHEMA")
     elif database_name:
-        statement += " IN DATABASE"
+        clauses.append("IN DATABASE")
     else:
-        statement += " IN ACCOUNT"
+        clauses.append("IN ACCOUNT")
 
-    if database_name:
-        statement += f" {database_name}"
-    if schema_name:
-        statement += f".{schema_name}"
-    if view_name:
-        statement += f".{view_name}"
+    scope = ".".join(name for name in (database_name, schema_name, view_name) if name)
+    if scope:
+        clauses.append(scope)
 
     if starts_with:
-        statement += f" STARTS WITH '{starts_with}'"
+        clauses.append("STARTS WITH %(starts_with)s")
+        params["starts_with"] = starts_with
+
+    statement = " ".join(clauses)
 
     try:
-        result = execute_query(statement, snowflake_service)
+        result = execute_metadata_query(
+            statement, snowflake_service, refresh=refresh, params=params
+        )
         if not result:
             return f"No {expression_type.lower()} found."
         return result
@@ -116,7 +171,11 @@ def show_semantic_expressions(
 
 
 def get_semantic_view_ddl(
-    snowflake_service, view_name: str, database_name: str, schema_name: str
+    snowflake_service,
+    view_name: str,
+    database_name: str,
+    schema_name: str,
+    refresh: bool = False,
 ):
     if not database_name and not schema_name:
         raise SnowflakeException(
@@ -126,11 +185,21 @@ def get_semantic_view_ddl(
         raise SnowflakeException(
             tool="get_semantic_view_ddl", message="Please specify a view name."
         )
+    validate_identifiers(
+        "get_semantic_view_ddl",
+        view_name=view_name,
+        database_name=database_name,
+        schema_name=schema_name,
+    )
 
-    statement = f"SELECT GET_DDL('SEMANTIC_VIEW', '{database_name}.{schema_name}.{view_name}', TRUE) as DDL"
+    statement = "SELECT GET_DDL('SEMANTIC_VIEW', %(view)s, TRUE) as DDL"
+    params = {"view": f"{database_name}.{schema_name}.{view_name}"}
 
     try:
-        return execute_query(statement, snowflake_service)[0].get("DDL")
+        result = execute_metadata_query(
+            statement, snowflake_service, refresh=refresh, params=params
+        )
+        return result[0].get("DDL")
     except Exception as e:
         raise SnowflakeException(tool="get_semantic_view_ddl", message=e)
 
@@ -171,6 +240,13 @@ def write_semantic_view_query(
             message="Cannot specify both FACTS and METRICS in the same SEMANTIC_VIEW query",
         )
 
+    validate_identifiers(
+        "write_semantic_view_query",
+        view_name=view_name,
+        database_name=database_name,
+        schema_name=schema_name,
+    )
+
     statement = f"""SELECT * FROM SEMANTIC_VIEW (
         {database_name}.{schema_name}.{view_name}
     """
@@ -265,7 +341,7 @@ def initialize_semantic_manager_tools(server: FastMCP, snowflake_service):
         name="list_semantic_views",
         description="List all semantic views in the account, database, or schema.",
     )
-    def list_semantic_views_tool(
+    async def list_semantic_views_tool(
         database_name: Annotated[
             str | None,
             Field(
@@ -294,16 +370,30 @@ def initialize_semantic_manager_tools(server: FastMCP, snowflake_service):
                 default=None,
             ),
         ],
+        refresh: Annotated[
+            bool,
+            Field(
+                description="Bypass cached metadata and query Snowflake directly.",
+                default=False,
+            ),
+        ],
     ):
-        return list_semantic_views(
-            snowflake_service, database_name, schema_name, like, starts_with
+        return await run_blocking(
+            snowflake_service,
+            list_semantic_views,
+            snowflake_service,
+            database_name,
+            schema_name,
+            like,
+            starts_with,
+            refresh,
         )
 
     @server.tool(
         name="describe_semantic_view",
         description="Describe a semantic view.",
     )
-    def describe_semantic_view_tool(
+    async def describe_semantic_view_tool(
         view_name: Annotated[
             str, Field(description="The name of the semantic view to describe.")
         ],
@@ -319,16 +409,29 @@ def initialize_semantic_manager_tools(server: FastMCP, snowflake_service):
                 description="The name of the schema to describe the semantic view in."
             ),
         ],
+        refresh: Annotated[
+            bool,
+            Field(
+                description="Bypass cached metadata and query Snowflake directly.",
+                default=False,
+            ),
+        ],
     ):
-        return describe_semantic_view(
-            snowflake_service, view_name, database_name, schema_name
+        return await run_blocking(
+            snowflake_service,
+            describe_semantic_view,
+            snowflake_service,
+            view_name,
+            database_name,
+            schema_name,
+            refresh,
         )
 
     @server.tool(
         name="show_semantic_dimensions",
         description="Show all semantic dimensions in the account, database, or schema.",
     )
-    def show_semantic_dimensions_tool(
+    async def show_semantic_dimensions_tool(
         database_name: Annotated[
             str,
             Field(
@@ -357,8 +460,17 @@ def initialize_semantic_manager_tools(server: FastMCP, snowflake_service):
                 default=None,
             ),
         ],
+        refresh: Annotated[
+            bool,
+            Field(
+                description="Bypass cached metadata and query Snowflake directly.",
+                default=False,
+            ),
+        ],
     ):
-        return show_semantic_expressions(
+        return await run_blocking(
+            snowflake_service,
+            show_semantic_expressions,
             snowflake_service,
             "DIMENSIONS",
             database_name,
@@ -366,13 +478,14 @@ def initialize_semantic_manager_tools(server: FastMCP, snowflake_service):
             view_name,
             like,
             starts_with,
+            refresh,
         )
 
     @server.tool(
         name="show_semantic_metrics",
         description="Show all semantic metrics in the account, database, or schema.",
     )
-    def show_semantic_metrics_tool(
+    async def show_semantic_metrics_tool(
         database_name: Annotated[
             str,
             Field(description="The name of the database to show semantic metrics in."),
@@ -398,8 +511,17 @@ def initialize_semantic_manager_tools(server: FastMCP, snowflake_service):
                 default=None,
             ),
         ],
+        refresh: Annotated[
+            bool,
+            Field(
+                description="Bypass cached metadata and query Snowflake directly.",
+                default=False,
+            ),
+        ],
     ):
-        return show_semantic_expressions(
+        return await run_blocking(
+            snowflake_service,
+            show_semantic_expressions,
             snowflake_service,
             "METRICS",
             database_name,
@@ -407,13 +529,14 @@ def initialize_semantic_manager_tools(server: FastMCP, snowflake_service):
             view_name,
             like,
             starts_with,
+            refresh,
         )
 
     @server.tool(
         name="get_semantic_view_ddl",
         description="Get the DDL for a semantic view.",
     )
-    def get_semantic_view_ddl_tool(
+    async def get_semantic_view_ddl_tool(
         database_name: Annotated[
             str,
             Field(
@@ -429,9 +552,22 @@ def initialize_semantic_manager_tools(server: FastMCP, snowflake_service):
         view_name: Annotated[
             str, Field(description="The name of the semantic view to get the DDL for.")
         ],
+        refresh: Annotated[
+            bool,
+            Field(
+                description="Bypass cached metadata and query Snowflake directly.",
+                default=False,
+            ),
+        ],
     ):
-        return get_semantic_view_ddl(
-            snowflake_service, view_name, database_name, schema_name
+        return await run_blocking(
+            snowflake_service,
+            get_semantic_view_ddl,
+            snowflake_service,
+            view_name,
+            database_name,
+            schema_name,
+            refresh,
         )
 
     @server.tool(
@@ -508,7 +644,7 @@ def initialize_semantic_manager_tools(server: FastMCP, snowflake_service):
         name="query_semantic_view",
         description=query_semantic_view_prompt,
     )
-    def query_semantic_view_tool(
+    async def query_semantic_view_tool(
         database_name: Annotated[
             str,
             Field(description="The name of the database containing the semantic view."),
@@ -562,7 +698,9 @@ def initialize_semantic_manager_tools(server: FastMCP, snowflake_service):
             ),
         ],
     ):
-        return query_semantic_view(
+        return await run_blocking(
+            snowflake_service,
+            query_semantic_view,
             snowflake_service,
             view_name,
             database_name,
@@ -8,44 +8,102 @@ Main server module for Snowflake MCP integration
 from __future__ import annotations
 
 import argparse
+import asyncio
+import atexit
 import logging
 import os
+import signal
 import sys
+import threading
+from contextlib import contextmanager
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Optional, TypeAlias
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Callable, Iterator, Mapping, Optional, TypeAlias
 
-import snowflake.connector
-import yaml
+from cachetools import TTLCache
 from fastmcp import FastMCP
-from snowflake.connector import DictCursor
-from snowflake.core import Root
 
-# Import the various tool modules
-from mcp_server_snowflake.cortex_services.tools import (
-    create_cortex_analyst_wrapper,
-    create_search_wrapper,
-)
-from mcp_server_snowflake.object_manager.tools import initialize_object_manager_tools
-from mcp_server_snowflake.query_manager.tools import initialize_query_manager_tool
-from mcp_server_snowflake.semantic_manager.tools import initialize_semantic_manager_tools
-from mcp_server_snowflake.server_utils import initialize_middleware
+from mcp_server_snowflake.connection_pool import ConnectionPool
 from mcp_server_snowflake.utils import (
     MissingArgumentsException,
     cleanup_snowflake_service,
     get_login_params,
+    load_yaml,
     sanitize_tool_name,
     unpack_sql_statement_permissions,
 )
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+if TYPE_CHECKING:
+    from snowflake.connector import SnowflakeConnection
+    from snowflake.core import Root
+
 logger = logging.getLogger(__name__)
 
 # Type aliases
 ConnectionParams: TypeAlias = dict[str, str | int | bool]
 ServiceConfig: TypeAlias = dict[str, Any]
 
+# Settings for connections that run tool queries: keep sessions alive between
+# tool calls, and return scaled NUMBER columns from Arrow batches as Decimal
+# rather than float64 so they match the DictCursor path
+POOLED_CONNECTION_PARAMS: Mapping[str, str | int | bool] = MappingProxyType(
+    {
+        "client_session_keep_alive": True,
+        "client_session_keep_alive_heartbeat_frequency": 900,
+        "arrow_number_to_decimal": True,
+    }
+)
+
+# Tag every query issued by the server; shared read-only across all calls
+QUERY_TAG_PARAMS: Mapping[str, str] = MappingProxyType(
+    {"QUERY_TAG": "mcp-server-snowflake"}
+)
+
+
+@lru_cache(maxsize=None)
+def _env(name: str) -> str | None:
+    """Read an environment variable once; call ``_env.cache_clear()`` to re-read."""
+    return os.getenv(name)
+
+
+@lru_cache(maxsize=1)
+def _env_connection_params() -> Mapping[str, str]:
+    """Assemble connection parameters from the environment once per process."""
+    params: ConnectionParams = {
+        "account": _env("SNOWFLAKE_ACCOUNT") or "",
+        "user": _env("SNOWFLAKE_USER") or "",
+        "password": _env("SNOWFLAKE_PASSWORD") or "",
+    }
+    
+    # Add optional parameters if provided
+    optional_params: dict[str, str | None] = {
+        "warehouse": _env("SNOWFLAKE_WAREHOUSE"),
+        "database": _env("SNOWFLAKE_DATABASE"),
+        "schema": _env("SNOWFLAKE_SCHEMA"),
+        "role": _env("SNOWFLAKE_ROLE"),
+    }
+    
+    for key, value in optional_params.items():
+        if value:
+            params[key] = value
+    
+    # Validate required parameters
+    missing: list[str] = []
+    if not params.get("account"):
+        missing.append("SNOWFLAKE_ACCOUNT")
+    if not params.get("user"):
+        missing.append("SNOWFLAKE_USER")
+    if not params.get("password"):
+        missing.append("SNOWFLAKE_PASSWORD")
+    
+    if missing:
+        raise MissingArgumentsException(missing)
+    
+    return MappingProxyType({k: v for k, v in params.items() if v})
+
+
 # Initialize FastMCP server
 mcp = FastMCP(
     name="Snowflake MCP Server",
@@ -53,13 +111,13 @@ mcp = FastMCP(
 )
 
 
-@dataclass
+@dataclass(slots=True, kw_only=True, frozen=False)
 class SnowflakeService:
     """Manages Snowflake database connections and configuration."""
     
     service_config_file: Path | None = None
     transport: str = "stdio"
-    connection_params: ConnectionParams = field(default_factory=dict)
+    connection_params: Mapping[str, str | int | bool] = field(default_factory=dict)
     
     # Service configurations
     search_services: list[ServiceConfig] = field(default_factory=list)
@@ -67,12 +125,28 @@ class SnowflakeService:
     object_manager_enabled: bool = True
     query_manager_enabled: bool = True
     semantic_manager_enabled: bool = True
-    sql_statement_allowed: list[str] = field(default_factory=list)
-    sql_statement_disallowed: list[str] = field(default_factory=list)
+    sql_statement_allowed: frozenset[str] = field(default_factory=frozenset)
+    sql_statement_disallowed: frozenset[str] = field(default_factory=frozenset)
+    
+    # Connection pool settings
+    pool_size: int = 5
+    pool_timeout: float = 120
+    pool_min_size: int = 0
+    pool_lifetime: float = 1800
+    pool_validate: bool = True
+    
+    # Seconds to cache SHOW/DESCRIBE metadata results
+    metadata_cache_ttl: float = 60
     
     # Runtime attributes
-    connection: snowflake.connector.SnowflakeConnection | None = field(default=None, init=False)
+    connection: SnowflakeConnection | None = field(default=None, init=False)
     root: Root | None = field(default=None, init=False)
+    pool: ConnectionPool | None = field(default=None, init=False)
+    metadata_cache: TTLCache | None = field(default=None, init=False)
+    metadata_cache_lock: threading.Lock = field(default_factory=threading.Lock, init=False)
+    query_semaphore: asyncio.Semaphore | None = field(default=None, init=False)
+    api_host: str = field(default="", init=False)
+    api_headers: Mapping[str, str] = field(default_factory=dict, init=False)
     
     def __post_init__(self) -> None:
         """Initialize the Snowflake service after dataclass initialization."""
@@ -84,174 +158,229 @@ class SnowflakeService:
         if not self.connection_params:
             self.connection_params = self._get_connection_params_from_env()
         
+        # Freeze once so every connection shares one read-only copy
+        self.connection_params = MappingProxyType(dict(self.connection_params))
+        
         # Load service configuration if provided
         if self.service_config_file:
             self._load_service_config()
         
+        # Cache for SHOW/DESCRIBE metadata queries
+        self.metadata_cache = TTLCache(maxsize=1024, ttl=self.metadata_cache_ttl)
+        
+        # Bound concurrent tool calls to the number of pooled connections
+        self.query_semaphore = asyncio.Semaphore(self.pool_size)
+        
         # Initialize Snowflake connection and root
         self._initialize_connection()
+        
+        # REST endpoint and headers are fixed for the lifetime of the service
+        account = self.connection_params.get("account", "")
+        if not account.endswith(".snowflakecomputing.com"):
+            account = f"{account}.snowflakecomputing.com"
+        self.api_host = f"https://{account}"
+        self.api_headers = MappingProxyType(
+            {"Content-Type": "application/json", "Accept": "application/json"}
+        )
     
     def _resolve_path(self, path: str | Path) -> Path:
         """Resolve path to absolute, expanding ~ and relative paths."""
-        path_obj = Path(path).expanduser().resolve()
+        absolute = os.path.abspath(os.path.expanduser(path))
         
-        if not path_obj.exists():
-            raise FileNotFoundError(f"Service config file not found: {path}")
+        # A single stat checks existence, instead of resolve() walking the path
+        try:
+            os.stat(absolute)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Service config file not found: {path}") from None
         
-        return path_obj
+        return Path(absolute)
     
     def _get_connection_params_from_env(self) -> ConnectionParams:
         """Get connection parameters from environment variables."""
-        params: ConnectionParams = {
-            "account": os.getenv("SNOWFLAKE_ACCOUNT", ""),
-            "user": os.getenv("SNOWFLAKE_USER", ""),
-            "password": os.getenv("SNOWFLAKE_PASSWORD", ""),
-        }
-        
-        # Add optional parameters if provided
-        optional_params: dict[str, str | None] = {
-            "warehouse": os.getenv("SNOWFLAKE_WAREHOUSE"),
-            "database": os.getenv("SNOWFLAKE_DATABASE"),
-            "schema": os.getenv("SNOWFLAKE_SCHEMA"),
-            "role": os.getenv("SNOWFLAKE_ROLE"),
-        }
-        
-        for key, value in optional_params.items():
-            if value:
-                params[key] = value
-        
-        # Validate required parameters
-        missing: list[str] = []
-        if not params.get("account"):
-            missing.append("SNOWFLAKE_ACCOUNT")
-        if not params.get("user"):
-            missing.append("SNOWFLAKE_USER")
-        if not params.get("password"):
-            missing.append("SNOWFLAKE_PASSWORD")
-        
-        if missing:
-            raise MissingArgumentsException(missing)
-        
-        return {k: v for k, v in params.items() if v}
+        return dict(_env_connection_params())
     
     def _load_service_config(self) -> None:
         """Load service configuration from YAML file."""
         if not self.service_config_file:
             return
         
-        config_content = self.service_config_file.read_text()
-        config = yaml.safe_load(config_content)
+        # One unbuffered read of the raw bytes; the C loader decodes them itself
+        with self.service_config_file.open("rb", buffering=0) as config_file:
+            config = load_yaml(config_file.read()) or {}
         
-        # Load search services
-        self.search_services = config.get("search_services", [])
-        
-        # Load analyst services
-        self.analyst_services = config.get("analyst_services", [])
+        # Load search and analyst services
+        self.search_services = config.get("search_services") or []
+        self.analyst_services = config.get("analyst_services") or []
         
         # Load other services configuration
-        other_services = config.get("other_services", {})
-        self.object_manager_enabled = other_services.get("object_manager", True)
-        self.query_manager_enabled = other_services.get("query_manager", True)
-        self.semantic_manager_enabled = other_services.get("semantic_manager", True)
+        get = (config.get("other_services") or {}).get
+        self.object_manager_enabled = get("object_manager", True)
+        self.query_manager_enabled = get("query_manager", True)
+        self.semantic_manager_enabled = get("semantic_manager", True)
         
         # Load SQL statement permissions
-        sql_permissions = config.get("sql_statement_permissions", [])
+        sql_permissions = config.get("sql_statement_permissions") or []
         self.sql_statement_allowed, self.sql_statement_disallowed = unpack_sql_statement_permissions(sql_permissions)
     
     def _initialize_connection(self) -> None:
-        """Initialize Snowflake connection and root object."""
+        """Initialize Snowflake connection, root object and connection pool."""
+        # The connector and snowflake.core take seconds to import, so they are
+        # loaded here rather than at import; --help and argument errors skip them
+        from snowflake.connector import connect
+        from snowflake.core import Root
+        
+        pool_params = {**self.connection_params, **POOLED_CONNECTION_PARAMS}
+        
+        def open_connection() -> SnowflakeConnection:
+            # The connector writes into session_parameters, so each gets its own dict
+            return connect(**pool_params, session_parameters=dict(QUERY_TAG_PARAMS))
+        
+        self.pool = ConnectionPool(
+            creator=open_connection,
+            pool_size=self.pool_size,
+            timeout=self.pool_timeout,
+            min_size=self.pool_min_size,
+            lifetime=self.pool_lifetime,
+            validate=self.pool_validate,
+        )
+        
         try:
-            self.connection = snowflake.connector.connect(**self.connection_params)
+            # Root keeps its own connection: session changes made by pooled tool
+            # calls (USE ROLE, ALTER SESSION, ...) must not leak into it
+            self.connection = connect(**self.connection_params)
             self.root = Root(self.connection)
             logger.info("Successfully connected to Snowflake")
         except Exception as e:
-            logger.error(f"Failed to connect to Snowflake: {e}")
+            logger.error("Failed to connect to Snowflake: %s", e)
             self.connection = None
             self.root = None
     
+    @contextmanager
     def get_connection(
         self, 
         use_dict_cursor: bool = True, 
-        session_parameters: dict[str, Any] | None = None
-    ) -> tuple[snowflake.connector.SnowflakeConnection, Any]:
+        session_parameters: dict[str, Any] | None = None,
+        reuse_session: bool = True,
+    ) -> Iterator[tuple[SnowflakeConnection, Any]]:
         """
-        Create a Snowflake connection with optional cursor type.
+        Borrow a pooled Snowflake connection with optional cursor type.
+        
+        Pooled connections already carry the query tag session parameters. Any
+        other session parameters get a dedicated connection that is closed on exit.
+        Every statement run on the yielded cursor shares the one borrowed
+        connection, so multi-statement tools should run inside a single block.
         
         Args:
             use_dict_cursor: Whether to use dictionary cursor
             session_parameters: Optional session parameters
+            reuse_session: Return the connection to the pool afterwards; pass
+                False for statements that may change the session's role,
+                warehouse, database, schema or parameters
             
-        Returns:
+        Yields:
             Tuple of (connection, cursor)
         """
-        conn_params = self.connection_params.copy()
-        if session_parameters:
-            conn_params["session_parameters"] = session_parameters
+        if session_parameters and session_parameters != QUERY_TAG_PARAMS:
+            from snowflake.connector import connect
+            
+            conn = connect(
+                **self.connection_params,
+                **POOLED_CONNECTION_PARAMS,
+                session_parameters=session_parameters,
+            )
+            try:
+                with self._open_cursor(conn, use_dict_cursor) as cursor:
+                    yield conn, cursor
+            finally:
+                conn.close()
+            return
+        
+        with self.pool.connect(reuse=reuse_session) as conn:
+            with self._open_cursor(conn, use_dict_cursor) as cursor:
+                yield conn, cursor
+    
+    @staticmethod
+    def _open_cursor(conn: SnowflakeConnection, use_dict_cursor: bool) -> Any:
+        """Open a dictionary or tuple cursor on the given connection."""
+        from snowflake.connector import DictCursor
         
-        conn = snowflake.connector.connect(**conn_params)
-        cursor = conn.cursor(DictCursor) if use_dict_cursor else conn.cursor()
-        return conn, cursor
+        return conn.cursor(DictCursor) if use_dict_cursor else conn.cursor()
     
-    def get_query_tag_param(self) -> dict[str, str]:
+    def get_query_tag_param(self) -> Mapping[str, str]:
         """Get query tag parameters for tracking."""
-        return {"QUERY_TAG": "mcp-server-snowflake"}
+        return QUERY_TAG_PARAMS
     
     def get_api_host(self) -> str:
         """Get the API host for REST API calls."""
-        account = self.connection_params.get("account", "")
-        if not account.endswith(".snowflakecomputing.com"):
-            account = f"{account}.snowflakecomputing.com"
-        return f"https://{account}"
+        return self.api_host
     
-    def get_api_headers(self) -> dict[str, str]:
+    def get_api_headers(self) -> Mapping[str, str]:
         """Get headers for REST API calls."""
         # This would need proper auth implementation for production
-        return {
-            "Content-Type": "application/json",
-            "Accept": "application/json"
-        }
+        return self.api_headers
 
 
-def initialize_cortex_search_tools(server: FastMCP, snowflake_service: SnowflakeService) -> None:
-    """Initialize Cortex Search tools."""
-    for service_details in snowflake_service.search_services:
-        service_name = service_details.get("service_name", "")
+def _register_services(
+    server: FastMCP,
+    snowflake_service: SnowflakeService,
+    services: list[ServiceConfig],
+    prefix: str,
+    factory: Callable[..., Any],
+    default_description: str,
+) -> None:
+    """
+    Register one tool per configured Cortex service.
+    
+    Args:
+        server: FastMCP server to register tools on
+        snowflake_service: Service passed to each tool wrapper
+        services: Service configurations from the config file
+        prefix: Tool name prefix, e.g. "search"
+        factory: Wrapper factory taking snowflake_service and service_details
+        default_description: Format string for tools without a description
+    """
+    tool = server.tool
+    # Only collect names for the summary when it will actually be logged
+    log_names = logger.isEnabledFor(logging.INFO)
+    tool_names: list[str] = []
+    
+    for service_details in services:
+        service_name = service_details.get("service_name")
         if not service_name:
             continue
         
-        tool_name = f"search_{sanitize_tool_name(service_name)}"
-        description = service_details.get("description", f"Search using {service_name}")
+        tool_name = f"{prefix}_{sanitize_tool_name(service_name)}"
+        description = service_details.get("description") or default_description.format(service_name)
         
-        # Create the search wrapper function
-        search_func = create_search_wrapper(
-            snowflake_service=snowflake_service,
-            service_details=service_details
+        # Create the wrapper function and register it with FastMCP
+        tool(name=tool_name, description=description)(
+            factory(snowflake_service=snowflake_service, service_details=service_details)
         )
-        
-        # Register the tool with FastMCP
-        server.tool(name=tool_name, description=description)(search_func)
-        logger.info(f"Registered Cortex Search tool: {tool_name}")
+        if log_names:
+            tool_names.append(tool_name)
+    
+    if log_names:
+        logger.info("Registered %s tools: %s", prefix, tool_names)
+
+
+def initialize_cortex_search_tools(server: FastMCP, snowflake_service: SnowflakeService) -> None:
+    """Initialize Cortex Search tools."""
+    from mcp_server_snowflake.cortex_services.tools import create_search_wrapper
+    
+    _register_services(
+        server, snowflake_service, snowflake_service.search_services,
+        "search", create_search_wrapper, "Search using {}",
+    )
 
 
 def initialize_cortex_analyst_tools(server: FastMCP, snowflake_service: SnowflakeService) -> None:
     """Initialize Cortex Analyst tools."""
-    for service_details in snowflake_service.analyst_services:
-        service_name = service_details.get("service_name", "")
-        if not service_name:
-            continue
-        
-        tool_name = f"analyst_{sanitize_tool_name(service_name)}"
-        description = service_details.get("description", f"Analyze using {service_name}")
-        
-        # Create the analyst wrapper function
-        analyst_func = create_cortex_analyst_wrapper(
-            snowflake_service=snowflake_service,
-            service_details=service_details
-        )
-        
-        # Register the tool with FastMCP
-        server.tool(name=tool_name, description=description)(analyst_func)
-        logger.info(f"Registered Cortex Analyst tool: {tool_name}")
+    from mcp_server_snowflake.cortex_services.tools import create_cortex_analyst_wrapper
+    
+    _register_services(
+        server, snowflake_service, snowflake_service.analyst_services,
+        "analyst", create_cortex_analyst_wrapper, "Analyze using {}",
+    )
 
 
 def initialize_all_tools(server: FastMCP, snowflake_service: SnowflakeService) -> None:
@@ -263,33 +392,50 @@ def initialize_all_tools(server: FastMCP, snowflake_service: SnowflakeService) -
     if snowflake_service.analyst_services:
         initialize_cortex_analyst_tools(server, snowflake_service)
     
-    # Initialize other managers if enabled
+    # Initialize other managers if enabled, importing only the ones in use
     if snowflake_service.object_manager_enabled:
+        from mcp_server_snowflake.object_manager.tools import (
+            initialize_object_manager_tools,
+        )
+        
         initialize_object_manager_tools(server, snowflake_service)
         logger.info("Initialized Object Manager tools")
     
     if snowflake_service.query_manager_enabled:
+        from mcp_server_snowflake.query_manager.tools import (
+            initialize_query_manager_tool,
+        )
+        
         initialize_query_manager_tool(server, snowflake_service)
         logger.info("Initialized Query Manager tools")
     
     if snowflake_service.semantic_manager_enabled:
+        from mcp_server_snowflake.semantic_manager.tools import (
+            initialize_semantic_manager_tools,
+        )
+        
         initialize_semantic_manager_tools(server, snowflake_service)
         logger.info("Initialized Semantic Manager tools")
     
     # Initialize middleware for permission checking
+    from mcp_server_snowflake.server_utils import initialize_middleware
+    
     initialize_middleware(server, snowflake_service)
     logger.info("Initialized middleware")
 
 
-def parse_arguments() -> argparse.Namespace:
-    """Parse command line arguments."""
+# Login parameter flags, defaults and help text; shared by the parser and main
+_LOGIN_PARAMS: dict[str, list] = get_login_params()
+_LOGIN_PARAM_NAMES: tuple[str, ...] = tuple(_LOGIN_PARAMS)
+
+
+@lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command line parser once per process."""
     parser = argparse.ArgumentParser(description="Snowflake MCP Server")
     
-    # Get login parameters configuration
-    login_params = get_login_params()
-    
     # Add arguments for each login parameter
-    for param_name, param_config in login_params.items():
+    for param_name, param_config in _LOGIN_PARAMS.items():
         flags = param_config[:2]  # First two items are the flag names
         default = param_config[2]  # Third item is default value
         help_text = param_config[3]  # Fourth item is help text
@@ -316,7 +462,12 @@ def parse_arguments() -> argparse.Namespace:
         help="Transport method for MCP server"
     )
     
-    return parser.parse_args()
+    return parser
+
+
+def parse_arguments() -> argparse.Namespace:
+    """Parse command line arguments."""
+    return _build_parser().parse_args()
 
 
 # Global Snowflake service instance
@@ -327,18 +478,29 @@ def main() -> None:
     """Main entry point for the server."""
     global snowflake_service
     
+    # Configure logging here rather than at import so embedding applications
+    # keep control of the root logger; MCP_LOG_LEVEL=WARNING silences startup logs
+    log_level = os.environ.get("MCP_LOG_LEVEL", "INFO").upper()
+    valid_level = log_level in logging.getLevelNamesMapping()
+    logging.basicConfig(
+        level=log_level if valid_level else logging.INFO,
+        format="%(asctime)s %(levelname)s %(name)s: %(message)s",
+    )
+    if not valid_level:
+        logger.warning("Unknown MCP_LOG_LEVEL %r, using INFO", log_level)
+    
+    # Exit normally on SIGTERM so atexit handlers still close the connections
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    
     try:
         # Parse command line arguments
         args = parse_arguments()
         
         # Build connection parameters from arguments
-        connection_params: ConnectionParams = {}
-        login_params = get_login_params()
-        
-        for param_name in login_params:
-            value = getattr(args, param_name, None)
-            if value:
-                connection_params[param_name] = value
+        arg_values = vars(args)
+        connection_params: ConnectionParams = {
+            name: arg_values[name] for name in _LOGIN_PARAM_NAMES if arg_values[name]
+        }
         
         # Initialize Snowflake service
         snowflake_service = SnowflakeService(
@@ -346,6 +508,7 @@ def main() -> None:
             transport=args.transport,
             connection_params=connection_params
         )
+        atexit.register(cleanup_snowflake_service, snowflake_service)
         
         # Initialize all tools
         initialize_all_tools(mcp, snowflake_service)
@@ -358,11 +521,8 @@ def main() -> None:
         logger.error(str(e))
         sys.exit(1)
     except Exception as e:
-        logger.error(f"Failed to start server: {e}")
+        logger.error("Failed to start server: %s", e)
         sys.exit(1)
-    finally:
-        if snowflake_service:
-            cleanup_snowflake_service(snowflake_service)
 
 
 if __name__ == "__main__":
@@ -9,7 +9,9 @@ from mcp_server_snowflake.query_manager.tools import validate_sql_type
 class CheckQueryType(Middleware):
     """Middleware that checks SQL statement to ensure it is of an approved type."""
 
-    def __init__(self, sql_allow_list: list[str], sql_disallow_list: list[str]):
+    def __init__(
+        self, sql_allow_list: frozenset[str], sql_disallow_list: frozenset[str]
+    ):
         self.sql_allow_list = sql_allow_list
         self.sql_disallow_list = sql_disallow_list
 
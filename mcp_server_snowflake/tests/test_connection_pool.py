@@ -0,0 +1,229 @@
+# Copyright 2025 Snowflake Inc.
+# SPDX-License-Identifier: Apache-2.0
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+# http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from mcp_server_snowflake.connection_pool import ConnectionPool
+from mcp_server_snowflake.server import SnowflakeService
+from mcp_server_snowflake.utils import execute_query
+
+
+def make_connection():
+    """Create a mock connection that reports itself as open."""
+    conn = MagicMock()
+    conn.is_closed.return_value = False
+    return conn
+
+
+def test_connection_is_reused():
+    """Test that a returned connection is handed out again instead of reconnecting."""
+    creator = MagicMock(side_effect=make_connection)
+    pool = ConnectionPool(creator, pool_size=2)
+
+    with pool.connect() as first:
+        pass
+    with pool.connect() as second:
+        pass
+
+    assert first is second
+    assert creator.call_count == 1
+
+
+def test_closed_connection_is_discarded():
+    """Test that connections closed while borrowed are not returned to the pool."""
+    creator = MagicMock(side_effect=make_connection)
+    pool = ConnectionPool(creator, pool_size=2)
+
+    with pool.connect() as first:
+        first.is_closed.return_value = True
+    with pool.connect() as second:
+        pass
+
+    assert first is not second
+    assert creator.call_count == 2
+
+
+def test_pool_size_is_enforced():
+    """Test that borrowing beyond pool_size times out."""
+    pool = ConnectionPool(make_connection, pool_size=1, timeout=0.01)
+
+    with pool.connect():
+        with pytest.raises(TimeoutError):
+            with pool.connect():
+                pass
+
+
+def test_close_drains_idle_connections():
+    """Test that close() closes every idle connection."""
+    pool = ConnectionPool(make_connection, pool_size=2)
+
+    with pool.connect() as first, pool.connect() as second:
+        pass
+    pool.close()
+
+    first.close.assert_called_once()
+    second.close.assert_called_once()
+
+
+def test_expired_connection_is_closed():
+    """Test that connections past the pool lifetime are closed instead of reused."""
+    creator = MagicMock(side_effect=make_connection)
+    pool = ConnectionPool(creator, pool_size=2, lifetime=0)
+
+    with pool.connect() as first:
+        pass
+    with pool.connect() as second:
+        pass
+
+    first.close.assert_called_once()
+    assert first is not second
+    assert creator.call_count == 2
+
+
+def test_invalid_connection_is_replaced():
+    """Test that idle connections failing validation are discarded on checkout."""
+    creator = MagicMock(side_effect=make_connection)
+    pool = ConnectionPool(creator, pool_size=2, validate_interval=0)
+
+    with pool.connect() as first:
+        first.is_valid.return_value = False
+    with pool.connect() as second:
+        pass
+
+    first.close.assert_called_once()
+    assert first is not second
+
+
+def test_recently_returned_connection_skips_validation():
+    """Test that validation is skipped for connections returned moments ago."""
+    pool = ConnectionPool(make_connection, pool_size=2, validate_interval=60)
+
+    with pool.connect() as first:
+        pass
+    with pool.connect() as second:
+        pass
+
+    assert first is second
+    first.is_valid.assert_not_called()
+
+
+def test_min_size_opens_connections_up_front():
+    """Test that min_size connections are opened when the pool is created."""
+    creator = MagicMock(side_effect=make_connection)
+    pool = ConnectionPool(creator, pool_size=5, min_size=2)
+
+    assert creator.call_count == 2
+    with pool.connect(), pool.connect():
+        pass
+    assert creator.call_count == 2
+
+
+def test_min_size_connections_open_concurrently():
+    """Test that up-front connections are opened in parallel rather than one by one."""
+    barrier = threading.Barrier(3, timeout=5)
+
+    def creator():
+        # Only returns once all three logins are in flight at the same time
+        barrier.wait()
+        return make_connection()
+
+    pool = ConnectionPool(creator, pool_size=5, min_size=3)
+
+    with pool.connect(), pool.connect(), pool.connect():
+        pass
+    assert barrier.n_waiting == 0
+    assert not barrier.broken
+
+
+def test_failed_min_size_connection_keeps_the_rest():
+    """Test that one failed up-front login does not discard the others."""
+    creator = MagicMock(
+        side_effect=[make_connection(), RuntimeError("login failed"), make_connection()]
+    )
+    pool = ConnectionPool(creator, pool_size=5, min_size=2)
+
+    with pool.connect(), pool.connect():
+        pass
+    assert creator.call_count == 3
+
+
+def test_connection_not_reused_when_requested():
+    """Test that a connection borrowed with reuse=False is closed instead of returned."""
+    creator = MagicMock(side_effect=make_connection)
+    pool = ConnectionPool(creator, pool_size=2)
+
+    with pool.connect(reuse=False) as first:
+        pass
+    with pool.connect() as second:
+        pass
+
+    first.close.assert_called_once()
+    assert first is not second
+
+
+def test_service_statements_share_one_connection():
+    """Test that statements in one get_connection block reuse a single pooled connection."""
+    with (
+        patch("snowflake.connector.connect") as mock_connect,
+        patch("snowflake.core.Root"),
+    ):
+        mock_connect.side_effect = lambda **kwargs: make_connection()
+        service = SnowflakeService(
+            connection_params={"account": "a", "user": "u", "password": "p"}
+        )
+        primary_connects = mock_connect.call_count
+
+        with service.get_connection() as (conn, cur):
+            cur.execute("DESCRIBE TABLE T")
+            cur.execute("SHOW TABLES LIKE 'T'")
+        with service.get_connection() as (second_conn, _):
+            pass
+
+        assert conn is second_conn
+        assert conn is not service.connection
+        assert mock_connect.call_count == primary_connects + 1
+        assert cur.execute.call_count == 2
+
+
+def test_use_role_does_not_leak_into_next_borrow():
+    """Test that a USE ROLE run through one borrow is not seen by the next one."""
+
+    def make_session():
+        conn = make_connection()
+        conn.role = "PUBLIC"
+        cursor = conn.cursor.return_value.__enter__.return_value
+
+        def execute(statement, params=None):
+            if statement.upper().startswith("USE ROLE "):
+                conn.role = statement.split()[-1]
+
+        cursor.execute.side_effect = execute
+        cursor.fetch_arrow_batches.return_value = iter([])
+        return conn
+
+    with (
+        patch("snowflake.connector.connect") as mock_connect,
+        patch("snowflake.core.Root"),
+    ):
+        mock_connect.side_effect = lambda **kwargs: make_session()
+        service = SnowflakeService(
+            connection_params={"account": "a", "user": "u", "password": "p"}
+        )
+
+        execute_query("USE ROLE ACCOUNTADMIN", service)
+        with service.get_connection() as (conn, _):
+            pass
+
+        assert conn.role == "PUBLIC"
@@ -0,0 +1,300 @@
+# Copyright 2025 Snowflake Inc.
+# SPDX-License-Identifier: Apache-2.0
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+# http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import json
+import threading
+from contextlib import contextmanager
+from datetime import date
+from decimal import Decimal
+from unittest.mock import MagicMock
+
+import pytest
+from cachetools import TTLCache
+from snowflake.connector.errors import NotSupportedError
+
+from mcp_server_snowflake.utils import (
+    SnowflakeException,
+    encode_json_rows,
+    execute_metadata_query,
+    execute_query,
+    prefetch_batches,
+    validate_identifiers,
+)
+
+
+class FakeCursor:
+    """Cursor without Arrow support that pages through a fixed list of rows."""
+
+    def __init__(self, rows):
+        self.rows = list(rows)
+        self.fetch_calls = 0
+        self.arraysize = 1
+
+    def execute(self, statement, params=None):
+        self.statement = statement
+
+    def fetch_arrow_batches(self):
+        raise NotSupportedError
+
+    def fetchmany(self, size):
+        self.fetch_calls += 1
+        batch, self.rows = self.rows[:size], self.rows[size:]
+        return batch
+
+
+@pytest.fixture
+def fake_service():
+    """SnowflakeService stand-in whose connections return a FakeCursor."""
+    service = MagicMock()
+    service.cursor = FakeCursor({"ID": i} for i in range(25))
+    service.released = False
+
+    @contextmanager
+    def get_connection(
+        use_dict_cursor=True, session_parameters=None, reuse_session=True
+    ):
+        try:
+            yield MagicMock(), service.cursor
+        finally:
+            service.released = True
+
+    service.get_connection = get_connection
+    return service
+
+
+def test_fetchmany_fallback_returns_all_rows(fake_service, monkeypatch):
+    """Test that results are paged with fetchmany when Arrow is unavailable."""
+    monkeypatch.setattr("mcp_server_snowflake.utils.FETCH_BATCH_SIZE", 10)
+
+    result = execute_query("SELECT ID FROM T", fake_service)
+
+    assert result == [{"ID": i} for i in range(25)]
+    assert fake_service.cursor.arraysize == 10
+    assert fake_service.released
+
+
+def test_limit_stops_fetching_early(fake_service, monkeypatch):
+    """Test that a limit short-circuits fetching instead of slicing afterwards."""
+    monkeypatch.setattr("mcp_server_snowflake.utils.FETCH_BATCH_SIZE", 10)
+
+    result = execute_query("SELECT ID FROM T", fake_service, limit=5)
+
+    assert result == [{"ID": i} for i in range(5)]
+    assert fake_service.cursor.fetch_calls == 1
+    assert fake_service.released
+
+
+def test_progress_is_delivered_before_the_result(fake_service, monkeypatch):
+    """Test that every progress notification has been sent when the query tool returns."""
+    from fastmcp import FastMCP
+
+    from mcp_server_snowflake.query_manager.tools import initialize_query_manager_tool
+
+    monkeypatch.setattr("mcp_server_snowflake.utils.FETCH_BATCH_SIZE", 10)
+    fake_service.query_semaphore = asyncio.Semaphore(1)
+    fake_service.metadata_cache = TTLCache(maxsize=8, ttl=60)
+    fake_service.metadata_cache_lock = threading.Lock()
+    sent = []
+
+    class SlowContext:
+        async def report_progress(self, progress, total=None, message=None):
+            await asyncio.sleep(0.05)
+            sent.append(progress)
+
+    server = FastMCP("test")
+    initialize_query_manager_tool(server, fake_service)
+    run_query_tool = asyncio.run(server.get_tools())["run_snowflake_query"].fn
+
+    result = asyncio.run(run_query_tool("SELECT ID FROM T", ctx=SlowContext()))
+
+    assert len(json.loads(result)) == 25
+    assert sorted(sent) == [10, 20, 25]
+
+
+def test_encode_json_rows_splices_batches():
+    """Test that batches are encoded into one JSON array, including Snowflake types."""
+    batches = [
+        [{"ID": 1, "AMOUNT": Decimal("1.50")}],
+        [],
+        [{"ID": 2, "CREATED_ON": date(2025, 1, 2)}],
+    ]
+
+    encoded = encode_json_rows(batches)
+
+    assert json.loads(encoded) == [
+        {"ID": 1, "AMOUNT": "1.50"},
+        {"ID": 2, "CREATED_ON": "2025-01-02"},
+    ]
+    assert encode_json_rows([]) == "[]"
+
+
+def test_encode_json_rows_handles_wide_integers():
+    """Test that integers beyond 64 bits, e.g. NUMBER(38,0), are still encoded."""
+    batches = [[{"ID": 1}], [{"BIG": 10**20, "AMOUNT": Decimal("2.5")}]]
+
+    encoded = encode_json_rows(batches)
+
+    assert json.loads(encoded) == [{"ID": 1}, {"BIG": 10**20, "AMOUNT": "2.5"}]
+
+
+def test_metadata_query_is_cached(monkeypatch):
+    """Test that repeated metadata queries are served from cache unless refreshed."""
+    service = MagicMock()
+    service.metadata_cache = TTLCache(maxsize=8, ttl=60)
+    service.metadata_cache_lock = threading.Lock()
+    mock_execute = MagicMock(return_value=[{"name": "DB"}])
+    monkeypatch.setattr("mcp_server_snowflake.utils.execute_query", mock_execute)
+
+    first = execute_metadata_query("SHOW DATABASES", service)
+    second = execute_metadata_query("SHOW DATABASES", service)
+    assert first == second == [{"name": "DB"}]
+    assert mock_execute.call_count == 1
+
+    execute_metadata_query("SHOW DATABASES", service, refresh=True)
+    assert mock_execute.call_count == 2
+
+    execute_metadata_query("SHOW DATABASES", service, limit=10)
+    assert mock_execute.call_count == 3
+
+
+def test_object_changes_invalidate_metadata_cache(monkeypatch):
+    """Test that listing objects after creating one re-queries instead of hitting the cache."""
+    from fastmcp import FastMCP
+
+    from mcp_server_snowflake.object_manager import tools as object_tools
+
+    service = MagicMock()
+    service.metadata_cache = TTLCache(maxsize=8, ttl=60)
+    service.metadata_cache_lock = threading.Lock()
+    service.query_semaphore = asyncio.Semaphore(1)
+    mock_execute = MagicMock(return_value=[{"name": "DB"}])
+    monkeypatch.setattr("mcp_server_snowflake.utils.execute_query", mock_execute)
+    monkeypatch.setattr(object_tools, "create_object", MagicMock())
+    server = FastMCP("test")
+    object_tools.initialize_object_manager_tools(server, service)
+    create_object_tool = asyncio.run(server.get_tools())["create_object"].fn
+
+    execute_metadata_query("SHOW DATABASES", service)
+    asyncio.run(create_object_tool("database", '{"name": "NEW_DB"}'))
+    execute_metadata_query("SHOW DATABASES", service)
+
+    object_tools.create_object.assert_called_once()
+    assert mock_execute.call_count == 2
+
+
+def test_drop_columns_without_arrow(fake_service):
+    """Test that dropped columns are removed from rows on the fetchmany path."""
+    fake_service.cursor = FakeCursor([{"name": "V", "extension": "{}"}])
+
+    result = execute_query(
+        "SHOW SEMANTIC VIEWS", fake_service, drop_columns=frozenset({"extension"})
+    )
+
+    assert result == [{"name": "V"}]
+
+
+def test_drop_columns_on_arrow_batches(fake_service):
+    """Test that dropped columns are also removed from rows built from Arrow batches."""
+    pa = pytest.importorskip("pyarrow")
+    batch = pa.record_batch({"name": ["V"], "extension": ["{}"]})
+    fake_service.cursor = FakeCursor([])
+    fake_service.cursor.fetch_arrow_batches = lambda: iter([batch])
+
+    result = execute_query(
+        "SHOW SEMANTIC VIEWS", fake_service, drop_columns=frozenset({"extension"})
+    )
+
+    assert result == [{"name": "V"}]
+
+
+def test_prefetch_batches_preserves_order_and_closes_source():
+    """Test that prefetching yields every batch in order and closes the source."""
+    closed = []
+
+    def source():
+        try:
+            yield from ([i] for i in range(5))
+        finally:
+            closed.append(True)
+
+    assert list(prefetch_batches(source())) == [[i] for i in range(5)]
+    assert closed == [True]
+
+    prefetched = prefetch_batches(source())
+    assert next(prefetched) == [0]
+    prefetched.close()
+    assert closed == [True, True]
+
+
+def test_prefetch_batches_propagates_errors():
+    """Test that an error raised while fetching surfaces to the consumer."""
+
+    def source():
+        yield [1]
+        raise RuntimeError("fetch failed")
+
+    prefetched = prefetch_batches(source())
+    assert next(prefetched) == [1]
+    with pytest.raises(RuntimeError, match="fetch failed"):
+        next(prefetched)
+
+
+@pytest.mark.parametrize(
+    "names",
+    [
+        {"database_name": "DB"},
+        {"database_name": '"My Db"', "schema_name": '"x"', "view_name": '"a""b"'},
+        {"schema_name": "db.schema"},
+        {"database_name": None, "view_name": "V"},
+    ],
+)
+def test_validate_identifiers_accepts_valid_names(names):
+    """Test that plain and quoted identifiers are accepted at their own depth."""
+    validate_identifiers("describe_semantic_view", **names)
+
+
+@pytest.mark.parametrize(
+    "names",
+    [
+        {"database_name": "x; DROP TABLE T"},
+        {"database_name": "1abc"},
+        {"database_name": '"a"b"'},
+        {"database_name": "db.schema"},
+        {"database_name": "DB", "schema_name": "db.schema"},
+        {"schema_name": "a.b.c"},
+        {"view_name": "a.b.c"},
+    ],
+)
+def test_validate_identifiers_rejects_invalid_names(names):
+    """Test that malformed or over-qualified names are rejected before any SQL is built."""
+    with pytest.raises(SnowflakeException):
+        validate_identifiers("describe_semantic_view", **names)
+
+
+@pytest.mark.parametrize("like", ["sales", None])
+def test_percent_in_quoted_identifier_survives_binding(monkeypatch, like):
+    """Test that a % in a quoted database name is kept when patterns are bound."""
+    from mcp_server_snowflake.object_manager import tools as object_tools
+
+    captured = {}
+
+    def fake_metadata_query(statement, snowflake_service, params=None, **kwargs):
+        # Mirror the connector: pyformat interpolation only runs with params
+        captured["sql"] = statement % params if params else statement
+        return [{"name": "T"}]
+
+    monkeypatch.setattr(object_tools, "execute_metadata_query", fake_metadata_query)
+
+    object_tools.list_objects(MagicMock(), "table", database_name='"PCT%DB"', like=like)
+
+    assert 'IN DATABASE "PCT%DB"' in captured["sql"]
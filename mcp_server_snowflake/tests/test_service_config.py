@@ -11,6 +11,8 @@
 # limitations under the License.
 
 import os
+import subprocess
+import sys
 import tempfile
 from pathlib import Path
 from unittest.mock import MagicMock, patch
@@ -18,7 +20,12 @@ from unittest.mock import MagicMock, patch
 import pytest
 import yaml
 
-from mcp_server_snowflake.server import SnowflakeService
+from mcp_server_snowflake.query_manager.tools import validate_sql_type
+from mcp_server_snowflake.server import (
+    SnowflakeService,
+    _env,
+    _env_connection_params,
+)
 
 
 @pytest.fixture
@@ -35,8 +42,8 @@ def mock_connection_params():
 def mock_snowflake_connect():
     """Mock the Snowflake connection for all tests."""
     with (
-        patch("mcp_server_snowflake.server.connect") as mock_connect,
-        patch("mcp_server_snowflake.server.Root") as mock_root,
+        patch("snowflake.connector.connect") as mock_connect,
+        patch("snowflake.core.Root") as mock_root,
     ):
         mock_connect.return_value = MagicMock()
         mock_root.return_value = MagicMock()
@@ -275,4 +282,117 @@ def test_nonexistent_path_raises_error(nonexistent_path, mock_connection_params)
             service_config_file=nonexistent_path,
             transport="stdio",
             connection_params=mock_connection_params,
-        )
\ No newline at end of file
+        )
+
+
+def test_env_connection_params_are_cached(mock_snowflake_connect, monkeypatch):
+    """Test that environment connection parameters are read once until the cache is cleared"""
+    monkeypatch.setenv("SNOWFLAKE_ACCOUNT", "env_account")
+    monkeypatch.setenv("SNOWFLAKE_USER", "env_user")
+    monkeypatch.setenv("SNOWFLAKE_PASSWORD", "env_pat")
+    _env.cache_clear()
+    _env_connection_params.cache_clear()
+    try:
+        first = SnowflakeService()
+        monkeypatch.setenv("SNOWFLAKE_ACCOUNT", "other_account")
+        second = SnowflakeService()
+        assert first.connection_params["account"] == "env_account"
+        assert second.connection_params["account"] == "env_account"
+
+        _env.cache_clear()
+        _env_connection_params.cache_clear()
+        assert SnowflakeService().connection_params["account"] == "other_account"
+    finally:
+        _env.cache_clear()
+        _env_connection_params.cache_clear()
+
+
+def test_api_host_and_headers_computed_once(
+    mock_snowflake_connect, mock_connection_params
+):
+    """Test that the REST host and read-only headers are derived from the account"""
+    service = SnowflakeService(connection_params=mock_connection_params)
+
+    assert service.get_api_host() == "https://test_account.snowflakecomputing.com"
+    assert service.get_api_headers() is service.get_api_headers()
+    with pytest.raises(TypeError):
+        service.get_api_headers()["Authorization"] = "token"
+
+
+def test_pooled_connections_return_arrow_numbers_as_decimal(
+    mock_snowflake_connect, mock_connection_params
+):
+    """Test that pooled query connections keep NUMBER precision on the Arrow path"""
+    service = SnowflakeService(connection_params=mock_connection_params)
+
+    with service.get_connection():
+        pass
+
+    assert mock_snowflake_connect.call_args.kwargs["arrow_number_to_decimal"] is True
+
+
+def test_service_is_slotted_and_keyword_only(
+    mock_snowflake_connect, mock_connection_params
+):
+    """Test that the service has no per-instance dict and rejects positional arguments"""
+    service = SnowflakeService(connection_params=mock_connection_params)
+
+    assert not hasattr(service, "__dict__")
+    with pytest.raises(TypeError):
+        SnowflakeService(None, "stdio", mock_connection_params)
+
+
+def test_server_import_defers_snowflake_libraries():
+    """Test that importing the server module does not load the Snowflake libraries"""
+    code = (
+        "import sys, mcp_server_snowflake.server; "
+        "print(sorted(m for m in ('snowflake.connector', 'snowflake.core') if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "[]"
+
+
+def test_services_do_not_share_config_lists(
+    mock_snowflake_connect, valid_config_yaml, mock_connection_params
+):
+    """Test that services loaded from the same file get their own service lists"""
+    first = SnowflakeService(
+        service_config_file=str(valid_config_yaml),
+        connection_params=mock_connection_params,
+    )
+    first.search_services.clear()
+
+    second = SnowflakeService(
+        service_config_file=str(valid_config_yaml),
+        connection_params=mock_connection_params,
+    )
+    assert len(second.search_services) == 1
+    assert second.search_services is not first.search_services
+
+
+def test_sql_permissions_load_as_frozensets(
+    mock_snowflake_connect, tmp_path, mock_connection_params
+):
+    """Test that SQL statement permissions are normalized into lowercase frozensets"""
+    config_file = create_config_file(
+        tmp_path,
+        {"sql_statement_permissions": [{"Select": True}, {"Drop": False}]},
+        filename="permissions.yaml",
+    )
+    service = SnowflakeService(
+        service_config_file=str(config_file),
+        connection_params=mock_connection_params,
+    )
+
+    assert service.sql_statement_allowed == frozenset({"select"})
+    assert service.sql_statement_disallowed == frozenset({"drop"})
+    assert validate_sql_type(
+        "SELECT 1", service.sql_statement_allowed, service.sql_statement_disallowed
+    ) == ("Select", True)
+    assert validate_sql_type(
+        "DROP TABLE T",
+        service.sql_statement_allowed,
+        service.sql_statement_disallowed,
+    ) == ("Drop", False)
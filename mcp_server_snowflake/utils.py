@@ -9,41 +9,411 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-import json
+import asyncio
+import io
 import logging
 import os
 import re
-from functools import wraps
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from functools import lru_cache, wraps
+from itertools import chain
 from textwrap import dedent
-from typing import Awaitable, Callable, Optional, TypeVar, Union
-
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Iterable,
+    Iterator,
+    Optional,
+    TypeVar,
+    Union,
+)
+
+import orjson
+import pydantic_core
 import requests
 import yaml
 from pydantic import BaseModel
 from typing_extensions import ParamSpec
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
 logger = logging.getLogger(__name__)
 
 P = ParamSpec("P")
 R = TypeVar("R")
+T = TypeVar("T")
+
+# Sentinel returned by next() once a prefetched iterator is exhausted
+_EXHAUSTED = object()
+
+
+# Rows per network fetch; also bounds the number of rows held in memory at once
+FETCH_BATCH_SIZE = 10000
+
+# Statements that cannot change the session's role, warehouse, database, schema
+# or parameters, so their pooled connection can be handed to the next caller
+_READ_ONLY_RE = re.compile(
+    r"^\s*(?:select|with|show|describe|desc|explain)\b", re.IGNORECASE
+)
+_TRAILING_TERMINATOR_RE = re.compile(r"[\s;]+$")
+
 
+def is_read_only_statement(statement: str) -> bool:
+    """
+    Whether a statement leaves the session as it found it.
+
+    Only single SELECT/WITH/SHOW/DESCRIBE/EXPLAIN statements qualify; USE,
+    ALTER SESSION, CALL and anything containing a further statement do not.
+    """
+    if not _READ_ONLY_RE.match(statement):
+        return False
+    return ";" not in _TRAILING_TERMINATOR_RE.sub("", statement)
+
+
+def iter_query_batches(
+    statement: str,
+    snowflake_service,
+    limit: int | None = None,
+    params: dict | None = None,
+    drop_columns: frozenset[str] = frozenset(),
+) -> Iterator[list[dict]]:
+    """
+    Execute a Snowflake query and yield the results in batches of row dictionaries.
+
+    Streams Apache Arrow result batches when the connector can produce them and
+    otherwise pages through the result set with ``fetchmany``. Only one batch is
+    held in memory at a time, regardless of the size of the result set.
+
+    Parameters
+    ----------
+    statement : str
+        SQL statement to execute
+    snowflake_service : SnowflakeService
+        The Snowflake service instance to use for connection
+    limit : int, optional
+        Stop fetching once this many rows have been yielded, by default None
+    params : dict, optional
+        Values bound to ``%(name)s`` placeholders in the statement, by default None
+    drop_columns : frozenset[str], optional
+        Column names to leave out of every row, by default empty
+
+    Yields
+    ------
+    list[dict]
+        Batch of rows with column names as keys
+    """
+    # Deferred so importing utils does not load the Snowflake connector
+    from snowflake.connector.errors import (
+        MissingDependencyError,
+        NotSupportedError,
+        ProgrammingError,
+    )
 
-def execute_query(statement: str, snowflake_service):
-    """Execute a Snowflake query and return the results using Python connector dictionary cursor."""
     with snowflake_service.get_connection(
         use_dict_cursor=True,
         session_parameters=snowflake_service.get_query_tag_param(),
+        # USE ROLE, ALTER SESSION, ... must not leak into later tool calls
+        reuse_session=is_read_only_statement(statement),
     ) as (
         con,
         cur,
     ):
-        cur.execute(statement)
-        return cur.fetchall()
+        cur.arraysize = FETCH_BATCH_SIZE
+        cur.execute(statement, params)
+
+        try:
+            arrow_batches = cur.fetch_arrow_batches()
+        except (MissingDependencyError, NotSupportedError, ProgrammingError):
+            # pyarrow is unavailable or the result set is not in Arrow format
+            arrow_batches = None
+
+        if arrow_batches is not None:
+            batches = (batch.to_pylist() for batch in arrow_batches)
+        else:
+            batches = iter(lambda: cur.fetchmany(FETCH_BATCH_SIZE), [])
+        if drop_columns:
+            batches = (_drop_columns(rows, drop_columns) for rows in batches)
+
+        remaining = limit
+        for rows in batches:
+            if remaining is not None:
+                rows = rows[:remaining]
+                remaining -= len(rows)
+            if rows:
+                yield rows
+            if remaining == 0:
+                return
+
+
+def _drop_columns(rows: list[dict], drop_columns: frozenset[str]) -> list[dict]:
+    """Return the rows without the dropped columns."""
+    return [{k: v for k, v in row.items() if k not in drop_columns} for row in rows]
+
+
+def execute_query(
+    statement: str,
+    snowflake_service,
+    limit: int | None = None,
+    params: dict | None = None,
+    drop_columns: frozenset[str] = frozenset(),
+):
+    """
+    Execute a Snowflake query and return the results as a list of row dictionaries.
+
+    Stops fetching once ``limit`` rows have been read instead of materializing
+    the full result set. Literal values should be passed through ``params`` and
+    referenced as ``%(name)s`` so the connector escapes them.
+    """
+    batches = iter_query_batches(
+        statement, snowflake_service, limit, params, drop_columns
+    )
+    with closing(batches):
+        return list(chain.from_iterable(batches))
+
+
+def execute_metadata_query(
+    statement: str,
+    snowflake_service,
+    limit: int | None = None,
+    refresh: bool = False,
+    params: dict | None = None,
+    drop_columns: frozenset[str] = frozenset(),
+):
+    """
+    Execute a SHOW/DESCRIBE style metadata query, serving repeats from a TTL cache.
+
+    Metadata rarely changes between consecutive tool calls, so results are cached
+    on the service keyed by the fully-qualified statement. Arbitrary SQL must use
+    ``execute_query`` instead.
+
+    Parameters
+    ----------
+    statement : str
+        Metadata SQL statement to execute
+    snowflake_service : SnowflakeService
+        The Snowflake service instance holding the metadata cache
+    limit : int, optional
+        Maximum number of rows to return, by default None
+    refresh : bool, optional
+        Bypass the cache and re-query Snowflake, by default False
+    params : dict, optional
+        Values bound to ``%(name)s`` placeholders in the statement, by default None
+    drop_columns : frozenset[str], optional
+        Column names to leave out of every row, by default empty
+
+    Returns
+    -------
+    list[dict]
+        List of dictionaries containing query results with column names as keys
+    """
+    key = (
+        statement,
+        tuple(sorted(params.items())) if params else None,
+        limit,
+        drop_columns,
+    )
+    cache = snowflake_service.metadata_cache
+    if not refresh:
+        with snowflake_service.metadata_cache_lock:
+            result = cache.get(key)
+        if result is not None:
+            return result
+
+    result = execute_query(statement, snowflake_service, limit, params, drop_columns)
+    with snowflake_service.metadata_cache_lock:
+        cache[key] = result
+    return result
+
+
+def clear_metadata_cache(snowflake_service) -> None:
+    """
+    Drop every cached metadata result after objects may have changed.
+
+    Called after tools that create, alter or drop objects, so the next
+    SHOW/DESCRIBE reflects the change instead of a result up to the TTL old.
+
+    Parameters
+    ----------
+    snowflake_service : SnowflakeService
+        The Snowflake service instance holding the metadata cache
+    """
+    with snowflake_service.metadata_cache_lock:
+        snowflake_service.metadata_cache.clear()
+
+
+def prefetch_batches(batches: Iterator[T]) -> Iterator[T]:
+    """
+    Fetch the next batch in a background thread while the current one is consumed.
+
+    Overlaps network fetches with whatever the caller does per batch (e.g. JSON
+    encoding), so total time approaches the slower of the two rather than their
+    sum. At most one batch is fetched ahead. The source iterator is closed when
+    the prefetching iterator is exhausted or closed.
+
+    Parameters
+    ----------
+    batches : Iterator[T]
+        Source iterator, e.g. from ``iter_query_batches``
+
+    Yields
+    ------
+    T
+        Items of ``batches`` in order
+    """
+    try:
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            pending = executor.submit(next, batches, _EXHAUSTED)
+            try:
+                while (batch := pending.result()) is not _EXHAUSTED:
+                    pending = executor.submit(next, batches, _EXHAUSTED)
+                    yield batch
+            finally:
+                pending.cancel()
+    finally:
+        # The executor has shut down, so the source is no longer running
+        if hasattr(batches, "close"):
+            batches.close()
+
+
+def encode_json_rows(batches: Iterable[list]) -> str:
+    """
+    Incrementally serialize batches of rows into a single JSON array.
+
+    Each batch is encoded as soon as it is produced, so fetching and encoding
+    interleave and only the current batch is held as Python objects.
+
+    Parameters
+    ----------
+    batches : Iterable[list]
+        Batches of JSON-serializable rows, e.g. from ``iter_query_batches``
+
+    Returns
+    -------
+    str
+        JSON array containing every row from every batch
+    """
+    buffer = io.BytesIO()
+    buffer.write(b"[")
+    separator = b""
+    for rows in batches:
+        if not rows:
+            continue
+        # Strip the enclosing brackets so batches splice into one array
+        buffer.write(separator)
+        try:
+            encoded = orjson.dumps(rows, default=str)
+        except orjson.JSONEncodeError:
+            # orjson rejects ints wider than 64 bits, e.g. NUMBER(38,0) values
+            encoded = pydantic_core.to_json(rows, fallback=str)
+        buffer.write(encoded[1:-1])
+        separator = b","
+    buffer.write(b"]")
+    return buffer.getvalue().decode()
+
+
+async def run_blocking(
+    snowflake_service, func: Callable[P, R], *args: P.args, **kwargs: P.kwargs
+) -> R:
+    """
+    Run a blocking Snowflake call in a worker thread without stalling the event loop.
+
+    Concurrency is bounded by the service's ``query_semaphore`` so no more calls
+    run at once than the connection pool can serve.
+
+    Parameters
+    ----------
+    snowflake_service : SnowflakeService
+        The Snowflake service instance holding the concurrency limit
+    func : Callable
+        Blocking function to run
+    *args, **kwargs
+        Arguments forwarded to ``func``
+
+    Returns
+    -------
+    Any
+        The return value of ``func``
+    """
+    async with snowflake_service.query_semaphore:
+        return await asyncio.to_thread(func, *args, **kwargs)
+
+
+# Unquoted Snowflake identifier, or a double-quoted one with "" as the escape
+_IDENT_PART = r'(?:[A-Za-z_][A-Za-z0-9_$]{0,254}|"(?:[^"]|""){1,255}")'
+_IDENT_RE = re.compile(_IDENT_PART)
+# Schema name that may carry its database, e.g. DB.SCHEMA
+_SCHEMA_RE = re.compile(rf"(?:{_IDENT_PART}\.)?{_IDENT_PART}")
+
+
+def validate_identifiers(
+    tool: str,
+    database_name: str | None = None,
+    schema_name: str | None = None,
+    view_name: str | None = None,
+) -> None:
+    """
+    Reject object names that are not valid Snowflake identifiers.
+
+    Names are interpolated into SHOW/DESCRIBE statements, which cannot bind
+    identifiers, so malformed names are rejected before any SQL is built or a
+    round-trip to Snowflake is made. Each name is checked at its own depth:
+    database and view names are single identifiers, and a schema name may only
+    be qualified with its database when no database name is given. Empty names
+    are skipped.
+
+    Parameters
+    ----------
+    tool : str
+        Name of the tool reported in the error
+    database_name : str, optional
+        Database identifier, by default None
+    schema_name : str, optional
+        Schema identifier, or ``DATABASE.SCHEMA`` without ``database_name``,
+        by default None
+    view_name : str, optional
+        Object identifier within the schema, by default None
+
+    Raises
+    ------
+    SnowflakeException
+        If any name is not a valid identifier
+    """
+    schema_re = _IDENT_RE if database_name else _SCHEMA_RE
+    for label, name, pattern in (
+        ("database_name", database_name, _IDENT_RE),
+        ("schema_name", schema_name, schema_re),
+        ("view_name", view_name, _IDENT_RE),
+    ):
+        if name and not pattern.fullmatch(name):
+            raise SnowflakeException(
+                tool=tool,
+                message=f"Invalid {label} {name!r}: expected a Snowflake identifier.",
+            )
+
+
+def escape_pyformat(name: str | None) -> str | None:
+    """
+    Double any ``%`` in an identifier spliced into a pyformat-bound statement.
+
+    Quoted identifiers may contain ``%``, which the connector would otherwise
+    read as a placeholder once the statement is bound with parameters.
+    """
+    return name.replace("%", "%%") if name else name
 
 
+_TOOL_NAME_INVALID_RE = re.compile(r"[^a-zA-Z0-9_]")
+
+
+@lru_cache(maxsize=512)
 def sanitize_tool_name(service_name: str) -> str:
     """Sanitize service name to create a valid Python identifier for MCP tool name."""
-    sanitized = re.sub(r"[^a-zA-Z0-9_]", "_", service_name)
+    sanitized = _TOOL_NAME_INVALID_RE.sub("_", service_name)
     if sanitized and sanitized[0].isdigit():
         sanitized = f"service_{sanitized}"
     return sanitized
@@ -51,8 +421,8 @@ def sanitize_tool_name(service_name: str) -> str:
 
 def unpack_sql_statement_permissions(
     sql_statement_permissions: list,
-) -> tuple[list[str], list[str]]:
-    """Unpack SQL statement permissions into a tuple of allowed and disallowed statements."""
+) -> tuple[frozenset[str], frozenset[str]]:
+    """Unpack SQL statement permissions into lowercase frozensets of allowed and disallowed statements."""
 
     allowed = []
     disallowed = []
@@ -62,7 +432,7 @@ def unpack_sql_statement_permissions(
                 allowed.append(sql_type.lower())
             else:
                 disallowed.append(sql_type.lower())
-    return allowed, disallowed
+    return frozenset(allowed), frozenset(disallowed)
 
 
 class AnalystResponse(BaseModel):
@@ -163,15 +533,7 @@ class SnowflakeResponse:
         snowflake.connector.errors.Error
             If connection fails or SQL execution encounters an error
         """
-        # Forward any remaining kwargs to get_connection
-        with service.get_connection(
-            use_dict_cursor=True, session_parameters=service.get_query_tag_param()
-        ) as (
-            con,
-            cur,
-        ):
-            cur.execute(statement)
-            return cur.fetchall()
+        return execute_query(statement, service)
 
     def parse_analyst_response(
         self, response: requests.Response | dict, service, **kwargs
@@ -273,8 +635,12 @@ class SnowflakeResponse:
                 snowflake_service = kwargs.get("snowflake_service")
                 match api:
                     case "analyst":
-                        parsed = self.parse_analyst_response(
-                            response=raw_sse, service=snowflake_service
+                        # Runs any generated SQL, so keep it off the event loop
+                        parsed = await run_blocking(
+                            snowflake_service,
+                            self.parse_analyst_response,
+                            response=raw_sse,
+                            service=snowflake_service,
                         )
                     case "search":
                         parsed = self.parse_search_response(response=raw_sse)
@@ -402,7 +768,34 @@ def cleanup_snowflake_service(snowflake_service):
             logger.info("Closing Snowflake connection...")
             snowflake_service.connection.close()
     except Exception as e:
-        logger.error(f"Error closing Snowflake connection: {e}")
+        logger.error("Error closing Snowflake connection: %s", e)
+
+    try:
+        if hasattr(snowflake_service, "pool") and snowflake_service.pool:
+            logger.info("Closing Snowflake connection pool...")
+            snowflake_service.pool.close()
+    except Exception as e:
+        logger.error("Error closing Snowflake connection pool: %s", e)
+
+
+def load_yaml(stream) -> Any:
+    """
+    Safely parse YAML from a string, bytes or open file.
+
+    Uses PyYAML's C ``CSafeLoader`` when available, which parses several times
+    faster than the pure-Python ``SafeLoader`` that ``yaml.safe_load`` uses.
+
+    Parameters
+    ----------
+    stream : str | bytes | IO
+        YAML document or a file object to read it from
+
+    Returns
+    -------
+    Any
+        The parsed document
+    """
+    return yaml.load(stream, Loader=_SafeLoader)
 
 
 async def load_tools_config_resource(file_path: str) -> str:
@@ -426,10 +819,10 @@ async def load_tools_config_resource(file_path: str) -> str:
     yaml.YAMLError
         If the YAML file is malformed
     """
-    with open(file_path, "r") as file:
-        tools_config = yaml.safe_load(file)
+    with open(file_path, "rb") as file:
+        tools_config = load_yaml(file)
 
-    return json.dumps(tools_config)
+    return orjson.dumps(tools_config).decode()
 
 
 def get_login_params() -> dict: